@@ -5,3 +5,17 @@ from .lib_graphe import (
     chemin_fluidification,
     chemin_travaux
 )
+from .lib_oracle import OracleDistances, construire_oracle, charger_oracle
+from .lib_partition import (
+    Cellule,
+    Region,
+    ServeurCellules,
+    ClientCellules,
+    RoutageOverlay,
+    partitionner,
+    decouper,
+    regrouper,
+    servir_cellules,
+    lancer_travailleur,
+    construire_overlay,
+)
@@ -0,0 +1,288 @@
+"""Description
+
+Oracle de distances par étiquetage de hubs (2-hop cover).
+
+Chaque sommet reçoit deux étiquettes triées : les hubs qu'il peut atteindre
+(étiquette de sortie) et les hubs qui peuvent l'atteindre (étiquette d'entrée),
+avec les distances associées. La distance entre 2 emplacements s'obtient en
+fusionnant l'étiquette de sortie du départ et l'étiquette d'entrée de l'arrivée.
+"""
+
+from dataclasses import dataclass
+import heapq
+
+import numpy as np
+
+from .lib_graphe import Graphe, bellman_ford
+
+
+@dataclass(frozen=True, eq=False)
+class OracleDistances:
+    """Dataclass représentant les étiquettes de hubs de la ville.
+
+        Les étiquettes sont stockées à plat (format CSR) : les hubs et distances de
+        l'étiquette du sommet i se trouvent entre offsets[i] et offsets[i + 1].
+        Les hubs sont identifiés par leur rang et triés par ordre croissant.
+
+        Exemple :
+
+    >>> oracle = construire_oracle(G)
+    >>> oracle.distance("1", "5")
+    7.0
+    """
+
+    sommets: list[str]
+    offsets_sortie: np.ndarray
+    hubs_sortie: np.ndarray
+    distances_sortie: np.ndarray
+    offsets_entree: np.ndarray
+    hubs_entree: np.ndarray
+    distances_entree: np.ndarray
+    graphe: Graphe | None = None
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "_indices", {sommet: i for i, sommet in enumerate(self.sommets)}
+        )
+
+    def _indice(self, sommet: str) -> int:
+        if sommet not in self._indices:
+            raise ValueError(f"{sommet=} n'est pas dans la liste des sommets!")
+        return self._indices[sommet]
+
+    def distance(self, depart: str, arrivee: str) -> float:
+        """Renvoie la distance la plus courte entre 2 emplacements de la ville.
+
+        Args:
+            depart (str): point de départ
+            arrivee (str): point d'arrivée
+
+        Raises:
+            ValueError: si l'un des emplacements n'existe pas
+
+        Returns:
+            float: distance la plus courte, inf si l'arrivée est inatteignable
+        """
+        i = self._indice(depart)
+        j = self._indice(arrivee)
+        # Les fenêtres sont converties en listes une seule fois : indexer les
+        # tableaux numpy élément par élément crée un scalaire numpy à chaque accès.
+        debut_s, fin_s = self.offsets_sortie[i : i + 2].tolist()
+        debut_e, fin_e = self.offsets_entree[j : j + 2].tolist()
+        hubs_s = self.hubs_sortie[debut_s:fin_s].tolist()
+        hubs_e = self.hubs_entree[debut_e:fin_e].tolist()
+        distances_s = self.distances_sortie[debut_s:fin_s].tolist()
+        distances_e = self.distances_entree[debut_e:fin_e].tolist()
+
+        meilleure = float("inf")
+        a, b = 0, 0
+        while a < len(hubs_s) and b < len(hubs_e):
+            if hubs_s[a] < hubs_e[b]:
+                a += 1
+            elif hubs_s[a] > hubs_e[b]:
+                b += 1
+            else:
+                total = distances_s[a] + distances_e[b]
+                if total < meilleure:
+                    meilleure = total
+                a += 1
+                b += 1
+        return meilleure
+
+    def distances(self, departs: list[str], arrivees: list[str]) -> np.ndarray:
+        """Renvoie les distances les plus courtes pour une liste de couples (départ, arrivée).
+
+        Toutes les fusions d'étiquettes sont faites en une seule passe vectorisée.
+
+        Args:
+            departs (list[str]): points de départ
+            arrivees (list[str]): points d'arrivée, de même longueur que departs
+
+        Raises:
+            ValueError: si les 2 listes n'ont pas la même longueur
+            ValueError: si l'un des emplacements n'existe pas
+
+        Returns:
+            np.ndarray: distances les plus courtes, inf si l'arrivée est inatteignable
+        """
+        if len(departs) != len(arrivees):
+            raise ValueError("Il faut autant de points de départ que d'arrivée")
+        i = np.array([self._indice(sommet) for sommet in departs], dtype=np.int64)
+        j = np.array([self._indice(sommet) for sommet in arrivees], dtype=np.int64)
+
+        couples_s, pos_s = _segments(self.offsets_sortie, i)
+        couples_e, pos_e = _segments(self.offsets_entree, j)
+
+        # Une clé (couple, hub) est croissante dans chaque étiquette, donc sur
+        # toute la concaténation : une recherche dichotomique suffit à la fusion.
+        nb_hubs = len(self.sommets)
+        cles_s = couples_s * nb_hubs + self.hubs_sortie[pos_s]
+        cles_e = couples_e * nb_hubs + self.hubs_entree[pos_e]
+
+        resultat = np.full(len(departs), np.inf)
+        if len(cles_e) == 0:
+            return resultat
+        rangs = np.minimum(np.searchsorted(cles_e, cles_s), len(cles_e) - 1)
+        communs = cles_e[rangs] == cles_s
+        totaux = (
+            self.distances_sortie[pos_s[communs]]
+            + self.distances_entree[pos_e[rangs[communs]]]
+        )
+        np.minimum.at(resultat, couples_s[communs], totaux)
+        return resultat
+
+    def chemin(self, depart: str, arrivee: str) -> dict:
+        """Renvoie le chemin optimal en se rabattant sur l'algorithme de bellman-ford.
+
+        Args:
+            depart (str): point de départ
+            arrivee (str): point d'arrivée
+
+        Raises:
+            ValueError: si l'oracle n'a pas de graphe associé
+
+        Returns:
+            dict: chemin optimal et distance parcourue
+        """
+        if self.graphe is None:
+            raise ValueError("Aucun graphe associé à l'oracle pour retrouver le chemin")
+        return bellman_ford(self.graphe, depart, arrivee)
+
+    def sauvegarder(self, fichier: str):
+        """Sauvegarde les étiquettes de l'oracle sur le disque au format npz, sous le nom exact indiqué."""
+        # Passer par un fichier ouvert évite que numpy ajoute l'extension .npz.
+        with open(fichier, "wb") as sortie:
+            np.savez_compressed(
+                sortie,
+                sommets=np.array(self.sommets, dtype=str),
+                offsets_sortie=self.offsets_sortie,
+                hubs_sortie=self.hubs_sortie,
+                distances_sortie=self.distances_sortie,
+                offsets_entree=self.offsets_entree,
+                hubs_entree=self.hubs_entree,
+                distances_entree=self.distances_entree,
+            )
+
+
+def _segments(offsets: np.ndarray, indices: np.ndarray) -> tuple:
+    """Renvoie, pour chaque position des étiquettes sélectionnées, le numéro du couple et la position dans le tableau à plat."""
+    debuts = offsets[indices]
+    longueurs = offsets[indices + 1] - debuts
+    couples = np.repeat(np.arange(len(indices)), longueurs)
+    decalages = np.arange(longueurs.sum()) - np.repeat(
+        np.cumsum(longueurs) - longueurs, longueurs
+    )
+    return couples, np.repeat(debuts, longueurs) + decalages
+
+
+def _dijkstra_elague(
+    voisins: list[list[tuple[int, float]]],
+    source: int,
+    rang: int,
+    etiquettes_source: dict,
+    etiquettes_cibles: list[dict],
+):
+    """Parcours de dijkstra depuis le hub source, élagué lorsque les étiquettes existantes donnent déjà la bonne distance."""
+    distance = {source: 0.0}
+    tas = [(0.0, source)]
+    while tas:
+        d, sommet = heapq.heappop(tas)
+        if d > distance[sommet]:
+            continue
+        etiquette = etiquettes_cibles[sommet]
+        deja_couvert = min(
+            (
+                d_hub + etiquette[hub]
+                for hub, d_hub in etiquettes_source.items()
+                if hub in etiquette
+            ),
+            default=float("inf"),
+        )
+        if deja_couvert <= d:
+            continue
+        etiquette[rang] = d
+        for voisin, poids in voisins[sommet]:
+            if d + poids < distance.get(voisin, float("inf")):
+                distance[voisin] = d + poids
+                heapq.heappush(tas, (d + poids, voisin))
+
+
+def _a_plat(etiquettes: list[dict]) -> tuple:
+    offsets = np.zeros(len(etiquettes) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(etiquette) for etiquette in etiquettes])
+    hubs = np.fromiter(
+        (hub for etiquette in etiquettes for hub in sorted(etiquette)),
+        dtype=np.int32,
+        count=offsets[-1],
+    )
+    distances = np.fromiter(
+        (etiquette[hub] for etiquette in etiquettes for hub in sorted(etiquette)),
+        dtype=np.float64,
+        count=offsets[-1],
+    )
+    return offsets, hubs, distances
+
+
+def construire_oracle(graphe: Graphe) -> OracleDistances:
+    """Fonction construisant l'oracle de distances de la ville par étiquetage élagué.
+
+        Les sommets sont traités par degré décroissant : les carrefours les plus
+        fréquentés deviennent les premiers hubs, ce qui garde les étiquettes courtes.
+
+    Args:
+        graphe (Graphe): Graphe de la ville
+
+    Returns:
+        OracleDistances: oracle de distances de la ville
+    """
+    indices = {sommet: i for i, sommet in enumerate(graphe.sommets)}
+    successeurs = [[] for _ in graphe.sommets]
+    predecesseurs = [[] for _ in graphe.sommets]
+    for depart, arrivee, poids in graphe.arretes:
+        successeurs[indices[depart]].append((indices[arrivee], poids))
+        predecesseurs[indices[arrivee]].append((indices[depart], poids))
+
+    ordre = sorted(
+        range(len(graphe.sommets)),
+        key=lambda i: len(successeurs[i]) + len(predecesseurs[i]),
+        reverse=True,
+    )
+    etiquettes_sortie = [{} for _ in graphe.sommets]
+    etiquettes_entree = [{} for _ in graphe.sommets]
+    for rang, hub in enumerate(ordre):
+        _dijkstra_elague(
+            successeurs, hub, rang, etiquettes_sortie[hub], etiquettes_entree
+        )
+        _dijkstra_elague(
+            predecesseurs, hub, rang, etiquettes_entree[hub], etiquettes_sortie
+        )
+
+    return OracleDistances(
+        list(graphe.sommets),
+        *_a_plat(etiquettes_sortie),
+        *_a_plat(etiquettes_entree),
+        graphe=graphe,
+    )
+
+
+def charger_oracle(fichier: str, graphe: Graphe | None = None) -> OracleDistances:
+    """Fonction chargeant un oracle de distances sauvegardé sur le disque.
+
+    Args:
+        fichier (str): fichier npz créé par OracleDistances.sauvegarder
+        graphe (Graphe, optional): Graphe de la ville, pour pouvoir retrouver les chemins
+
+    Returns:
+        OracleDistances: oracle de distances de la ville
+    """
+    with np.load(fichier) as donnees:
+        return OracleDistances(
+            [str(sommet) for sommet in donnees["sommets"]],
+            donnees["offsets_sortie"],
+            donnees["hubs_sortie"],
+            donnees["distances_sortie"],
+            donnees["offsets_entree"],
+            donnees["hubs_entree"],
+            donnees["distances_entree"],
+            graphe=graphe,
+        )
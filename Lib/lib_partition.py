@@ -0,0 +1,749 @@
+"""Description
+
+Découpage de la ville en cellules et routage par graphe de recouvrement (overlay).
+
+Chaque cellule garde ses routes internes et précalcule les distances entre ses
+sommets frontières (premier niveau). Les cellules sont regroupées en régions qui
+précalculent à leur tour les distances entre leurs sommets frontières (second
+niveau). Les régions peuvent être réparties sur plusieurs processus (ou machines)
+via un RPC local, le coordinateur ne gardant que les routes qui relient les
+régions entre elles et les tables des régions.
+
+    Exemple :
+
+>>> overlay = construire_overlay(Ex_graphe, 4, 2)
+>>> overlay.distance("1", "16")
+18.0
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from multiprocessing import AuthenticationError, Pipe, Process
+from multiprocessing.connection import Client, Listener
+import heapq
+import math
+import time
+
+from .lib_graphe import Graphe, _ralentissement
+
+
+@dataclass(frozen=True, unsafe_hash=True)
+class Cellule:
+    """Dataclass représentant une cellule de la ville.
+
+    identifiant représente le numéro de la cellule.
+    graphe représente les emplacements de la cellule et les routes internes à la cellule.
+    frontiere représente les emplacements reliés à une autre cellule.
+    """
+
+    identifiant: int
+    graphe: Graphe
+    frontiere: list[str]
+
+    def __post_init__(self):
+        for sommet in self.frontiere:
+            if sommet not in self.graphe.sommets:
+                raise ValueError(f"{sommet=} n'est pas dans la cellule!")
+
+
+@dataclass(frozen=True, unsafe_hash=True)
+class Region:
+    """Dataclass représentant une région de la ville, c'est à dire un groupe de cellules.
+
+    identifiant représente le numéro de la région.
+    cellules représente les cellules de la région.
+    coupure représente les sommets frontières des cellules et les routes entre cellules de la région.
+    frontiere représente les emplacements reliés à une autre région.
+    """
+
+    identifiant: int
+    cellules: list[Cellule]
+    coupure: Graphe
+    frontiere: list[str]
+
+    def __post_init__(self):
+        for sommet in self.frontiere:
+            if sommet not in self.coupure.sommets:
+                raise ValueError(f"{sommet=} n'est pas une frontière de la région!")
+
+
+def _dijkstra(graphe: Graphe, depart: str, inverse: bool = False) -> dict:
+    """Renvoie les distances depuis (ou vers, si inverse) le sommet de départ."""
+    voisins = {sommet: [] for sommet in graphe.sommets}
+    for sommet_depart, sommet_arrivee, poids in graphe.arretes:
+        if inverse:
+            voisins[sommet_arrivee].append((sommet_depart, poids))
+        else:
+            voisins[sommet_depart].append((sommet_arrivee, poids))
+
+    distances = {depart: 0.0}
+    tas = [(0.0, depart)]
+    while tas:
+        d, sommet = heapq.heappop(tas)
+        if d > distances[sommet]:
+            continue
+        for voisin, poids in voisins[sommet]:
+            if d + poids < distances.get(voisin, float("inf")):
+                distances[voisin] = d + poids
+                heapq.heappush(tas, (d + poids, voisin))
+    return distances
+
+
+def partitionner(graphe: Graphe, nb_cellules: int) -> dict[str, int]:
+    """Fonction répartissant les emplacements de la ville en cellules de tailles équivalentes.
+
+        Les cellules sont construites par parcours en largeur afin de regrouper
+        des emplacements voisins.
+
+    Args:
+        graphe (Graphe): Graphe de la ville
+        nb_cellules (int): nombre de cellules souhaité
+
+    Raises:
+        ValueError: si le nombre de cellules n'est pas strictement positif
+
+    Returns:
+        dict[str, int]: numéro de cellule de chaque emplacement
+    """
+    if nb_cellules <= 0:
+        raise ValueError("Le nombre de cellules doit être strictement positif")
+    voisins = {sommet: [] for sommet in graphe.sommets}
+    for depart, arrivee, _ in graphe.arretes:
+        voisins[depart].append(arrivee)
+        voisins[arrivee].append(depart)
+
+    taille = math.ceil(len(graphe.sommets) / nb_cellules)
+    cellule_de = {}
+    cellule = 0
+    remplissage = 0
+    for graine in graphe.sommets:
+        if graine in cellule_de:
+            continue
+        file = deque([graine])
+        while file:
+            sommet = file.popleft()
+            if sommet in cellule_de:
+                continue
+            if remplissage == taille:
+                cellule += 1
+                remplissage = 0
+            cellule_de[sommet] = cellule
+            remplissage += 1
+            file.extend(
+                voisin for voisin in voisins[sommet] if voisin not in cellule_de
+            )
+    return cellule_de
+
+
+def decouper(
+    graphe: Graphe, cellule_de: dict[str, int]
+) -> tuple[list[Cellule], Graphe]:
+    """Fonction découpant la ville en cellules.
+
+    Args:
+        graphe (Graphe): Graphe de la ville
+        cellule_de (dict[str, int]): numéro de cellule de chaque emplacement
+
+    Returns:
+        tuple[list[Cellule], Graphe]: les cellules, et le graphe des routes reliant 2 cellules
+    """
+    identifiants = sorted(set(cellule_de.values()))
+    internes = {identifiant: [] for identifiant in identifiants}
+    coupees = []
+    for depart, arrivee, poids in graphe.arretes:
+        if cellule_de[depart] == cellule_de[arrivee]:
+            internes[cellule_de[depart]].append((depart, arrivee, poids))
+        else:
+            coupees.append((depart, arrivee, poids))
+
+    frontiere = {
+        sommet for depart, arrivee, _ in coupees for sommet in (depart, arrivee)
+    }
+    cellules = []
+    for identifiant in identifiants:
+        sommets = [s for s in graphe.sommets if cellule_de[s] == identifiant]
+        cellules.append(
+            Cellule(
+                identifiant,
+                Graphe(sommets, internes[identifiant]),
+                [s for s in sommets if s in frontiere],
+            )
+        )
+    coupure = Graphe([s for s in graphe.sommets if s in frontiere], coupees)
+    return cellules, coupure
+
+
+def regrouper(
+    cellules: list[Cellule], coupure: Graphe, nb_regions: int
+) -> tuple[list[Region], Graphe]:
+    """Fonction regroupant les cellules en régions, second niveau du graphe de recouvrement.
+
+        Les cellules sont réparties avec partitionner, appliqué au graphe dont
+        les sommets sont les cellules et les arrêtes les routes entre cellules.
+
+    Args:
+        cellules (list[Cellule]): cellules de la ville
+        coupure (Graphe): graphe des routes reliant 2 cellules
+        nb_regions (int): nombre de régions souhaité
+
+    Returns:
+        tuple[list[Region], Graphe]: les régions, et le graphe des routes reliant 2 régions
+    """
+    cellule_de = {
+        sommet: cellule.identifiant
+        for cellule in cellules
+        for sommet in cellule.graphe.sommets
+    }
+    graphe_cellules = Graphe(
+        [str(cellule.identifiant) for cellule in cellules],
+        [
+            (str(cellule_de[depart]), str(cellule_de[arrivee]), poids)
+            for depart, arrivee, poids in coupure.arretes
+        ],
+    )
+    region_de = {
+        int(cellule): region
+        for cellule, region in partitionner(graphe_cellules, nb_regions).items()
+    }
+
+    identifiants = sorted(set(region_de.values()))
+    internes = {identifiant: [] for identifiant in identifiants}
+    coupees = []
+    for depart, arrivee, poids in coupure.arretes:
+        region = region_de[cellule_de[depart]]
+        if region == region_de[cellule_de[arrivee]]:
+            internes[region].append((depart, arrivee, poids))
+        else:
+            coupees.append((depart, arrivee, poids))
+
+    frontiere = {
+        sommet for depart, arrivee, _ in coupees for sommet in (depart, arrivee)
+    }
+    regions = []
+    for identifiant in identifiants:
+        membres = [c for c in cellules if region_de[c.identifiant] == identifiant]
+        sommets = [s for cellule in membres for s in cellule.frontiere]
+        regions.append(
+            Region(
+                identifiant,
+                membres,
+                Graphe(sommets, internes[identifiant]),
+                [s for s in sommets if s in frontiere],
+            )
+        )
+    coupure_regions = Graphe([s for s in coupure.sommets if s in frontiere], coupees)
+    return regions, coupure_regions
+
+
+def table_frontiere(cellule: Cellule) -> dict[str, dict[str, float]]:
+    """Fonction renvoyant les distances entre sommets frontières en restant dans la cellule.
+
+    Args:
+        cellule (Cellule): cellule de la ville
+
+    Returns:
+        dict[str, dict[str, float]]: distances entre sommets frontières atteignables
+    """
+    table = {}
+    for depart in cellule.frontiere:
+        distances = _dijkstra(cellule.graphe, depart)
+        table[depart] = {
+            arrivee: distances[arrivee]
+            for arrivee in cellule.frontiere
+            if arrivee in distances
+        }
+    return table
+
+
+def _inverser(table: dict[str, dict[str, float]]) -> dict[str, dict[str, float]]:
+    """Renvoie la table des distances dans le sens inverse (arrivée, puis départ)."""
+    inverse = {sommet: {} for sommet in table}
+    for depart, ligne in table.items():
+        for arrivee, distance in ligne.items():
+            inverse[arrivee][depart] = distance
+    return inverse
+
+
+class ServeurCellules:
+    """Travailleur gardant en mémoire une partie des régions de la ville et leurs tables de distances.
+
+    Pour chaque région, il garde la table de chacune de ses cellules (premier
+    niveau) et la table entre sommets frontières de la région (second niveau).
+    """
+
+    def __init__(self, regions: list[Region]):
+        self.regions = {}
+        self.cellule_de = {}
+        self.region_de = {}
+        self.tables = {}
+        self.tables_inverses = {}
+        self.tables_regions = {}
+        self._coupures = {}
+        self.charger(regions)
+
+    def charger(self, regions: list[Region]):
+        """Ajoute des régions au travailleur et précalcule leurs tables."""
+        for region in regions:
+            self._installer(
+                region, {cellule.identifiant for cellule in region.cellules}
+            )
+
+    def _installer(self, region: Region, cellules_modifiees: set[int]):
+        """Enregistre la région, recalcule les tables des cellules modifiées puis celle de la région."""
+        self.regions[region.identifiant] = region
+        for cellule in region.cellules:
+            self.region_de[cellule.identifiant] = region.identifiant
+            for sommet in cellule.graphe.sommets:
+                self.cellule_de[sommet] = cellule
+            if cellule.identifiant in cellules_modifiees:
+                table = table_frontiere(cellule)
+                self.tables[cellule.identifiant] = table
+                self.tables_inverses[cellule.identifiant] = _inverser(table)
+
+        sortantes = {sommet: [] for sommet in region.coupure.sommets}
+        entrantes = {sommet: [] for sommet in region.coupure.sommets}
+        for depart, arrivee, poids in region.coupure.arretes:
+            sortantes[depart].append((arrivee, poids))
+            entrantes[arrivee].append((depart, poids))
+        self._coupures[region.identifiant] = (sortantes, entrantes)
+
+        table = {}
+        for depart in region.frontiere:
+            distances = self._recherche(region.identifiant, depart)
+            table[depart] = {
+                arrivee: distances[arrivee]
+                for arrivee in region.frontiere
+                if arrivee in distances
+            }
+        self.tables_regions[region.identifiant] = table
+
+    def _region(self, identifiant: int) -> Region:
+        if identifiant not in self.regions:
+            raise ValueError(f"{identifiant=} n'est pas géré par ce travailleur!")
+        return self.regions[identifiant]
+
+    def _cellule(self, identifiant: int, sommet: str) -> Cellule:
+        self._region(identifiant)
+        cellule = self.cellule_de.get(sommet)
+        if cellule is None or self.region_de[cellule.identifiant] != identifiant:
+            raise ValueError(f"{sommet=} n'est pas dans la région!")
+        return cellule
+
+    def _recherche(self, identifiant: int, sommet: str, inverse: bool = False) -> dict:
+        """Distances depuis (ou vers) un sommet sans sortir de la région.
+
+        La recherche parcourt la cellule du sommet, puis le premier niveau du
+        graphe de recouvrement : routes entre cellules et tables des cellules.
+        """
+        cellule = self._cellule(identifiant, sommet)
+        distances = _dijkstra(cellule.graphe, sommet, inverse)
+        coupure = self._coupures[identifiant][1 if inverse else 0]
+        tables = self.tables_inverses if inverse else self.tables
+
+        tas = [(distances[s], s) for s in cellule.frontiere if s in distances]
+        heapq.heapify(tas)
+        while tas:
+            d, courant = heapq.heappop(tas)
+            if d > distances[courant]:
+                continue
+            table = tables[self.cellule_de[courant].identifiant][courant]
+            for voisin, poids in coupure[courant] + list(table.items()):
+                if d + poids < distances.get(voisin, float("inf")):
+                    distances[voisin] = d + poids
+                    heapq.heappush(tas, (d + poids, voisin))
+        return distances
+
+    def table(self, identifiant: int) -> dict[str, dict[str, float]]:
+        """Renvoie la table des distances entre sommets frontières de la région."""
+        self._region(identifiant)
+        return self.tables_regions[identifiant]
+
+    def distances_depuis(self, identifiant: int, sommet: str) -> dict[str, float]:
+        """Renvoie les distances depuis un sommet vers les sommets frontières de sa région."""
+        distances = self._recherche(identifiant, sommet)
+        return {
+            s: distances[s]
+            for s in self.regions[identifiant].frontiere
+            if s in distances
+        }
+
+    def distances_vers(self, identifiant: int, sommet: str) -> dict[str, float]:
+        """Renvoie les distances depuis les sommets frontières de sa région vers un sommet."""
+        distances = self._recherche(identifiant, sommet, inverse=True)
+        return {
+            s: distances[s]
+            for s in self.regions[identifiant].frontiere
+            if s in distances
+        }
+
+    def distance(self, identifiant: int, depart: str, arrivee: str) -> float:
+        """Renvoie la distance la plus courte entre 2 sommets sans sortir de leur région."""
+        distances = self._recherche(identifiant, depart)
+        cellule = self._cellule(identifiant, arrivee)
+        vers = _dijkstra(cellule.graphe, arrivee, inverse=True)
+        return min(
+            [distances.get(arrivee, float("inf"))]
+            + [
+                distances[s] + vers[s]
+                for s in cellule.frontiere
+                if s in distances and s in vers
+            ]
+        )
+
+    def ralentissement(
+        self, identifiant: int, sommet_depart: str, sommet_arrivee: str, temps: float
+    ):
+        """Applique un ralentissement à une route de la région.
+
+        Seule la table de la cellule concernée est recalculée (aucune si la
+        route relie 2 cellules), puis celle de la région.
+        """
+        region = self._region(identifiant)
+        cellule = self._cellule(identifiant, sommet_depart)
+        if cellule is self._cellule(identifiant, sommet_arrivee):
+            cellule = Cellule(
+                cellule.identifiant,
+                _ralentissement(cellule.graphe, sommet_depart, sommet_arrivee, temps),
+                cellule.frontiere,
+            )
+            cellules = [
+                cellule if c.identifiant == cellule.identifiant else c
+                for c in region.cellules
+            ]
+            region = Region(identifiant, cellules, region.coupure, region.frontiere)
+            self._installer(region, {cellule.identifiant})
+        else:
+            coupure = _ralentissement(
+                region.coupure, sommet_depart, sommet_arrivee, temps
+            )
+            region = Region(identifiant, region.cellules, coupure, region.frontiere)
+            self._installer(region, set())
+
+
+_METHODES_RPC = {
+    "charger",
+    "table",
+    "distances_depuis",
+    "distances_vers",
+    "distance",
+    "ralentissement",
+}
+
+
+def _traiter(serveur: ServeurCellules, requete) -> tuple | None:
+    """Renvoie la réponse à une requête RPC, ou None pour la requête d'arrêt."""
+    try:
+        methode, arguments = requete
+    except (TypeError, ValueError):
+        return ("erreur", f"Requête invalide : {requete!r}")
+    if methode == "arreter":
+        return None
+    if methode not in _METHODES_RPC:
+        return ("erreur", f"Méthode inconnue : {methode}")
+    try:
+        return ("ok", getattr(serveur, methode)(*arguments))
+    except Exception as erreur:
+        return ("erreur", f"{type(erreur).__name__}: {erreur}")
+
+
+def _servir_connexion(serveur: ServeurCellules, connexion) -> bool:
+    """Répond aux requêtes d'un coordinateur, renvoie False si le travailleur doit s'arrêter."""
+    while True:
+        try:
+            requete = connexion.recv()
+        except (EOFError, OSError):
+            return True
+        except Exception as erreur:
+            reponse = (
+                "erreur",
+                f"Requête illisible : {type(erreur).__name__}: {erreur}",
+            )
+        else:
+            reponse = _traiter(serveur, requete)
+
+        if reponse is None:
+            try:
+                connexion.send(("ok", None))
+            except OSError:
+                pass
+            return False
+        try:
+            connexion.send(reponse)
+        except OSError:
+            return True
+        except Exception as erreur:
+            # Le résultat n'a pas pu être sérialisé, rien n'a été écrit.
+            message = (
+                f"Réponse impossible à envoyer : {type(erreur).__name__}: {erreur}"
+            )
+            try:
+                connexion.send(("erreur", message))
+            except OSError:
+                return True
+
+
+def servir_cellules(regions: list[Region], adresse, authkey: bytes, annonce=None):
+    """Fonction faisant tourner un travailleur accessible par RPC local.
+
+        Chaque requête est un tuple (méthode, arguments) et reçoit en réponse
+        ("ok", résultat) ou ("erreur", message). La requête ("arreter", ())
+        arrête le travailleur. Une requête en erreur ou un coordinateur qui se
+        déconnecte n'arrête pas le travailleur, qui sert un coordinateur à la fois.
+        Les messages sont décodés avec pickle : la clé authkey doit rester secrète.
+
+    Args:
+        regions (list[Region]): régions gérées par ce travailleur, d'autres peuvent être envoyées avec "charger"
+        adresse: adresse d'écoute, par exemple ("localhost", 0) pour un port libre
+        authkey (bytes): clé partagée avec le coordinateur
+        annonce (Connection, optional): extrémité d'un Pipe où envoyer l'adresse réellement écoutée
+    """
+    serveur = ServeurCellules(regions)
+    with Listener(adresse, authkey=authkey) as ecoute:
+        if annonce is not None:
+            annonce.send(ecoute.address)
+        while True:
+            try:
+                connexion = ecoute.accept()
+            except (AuthenticationError, EOFError, OSError):
+                continue
+            with connexion:
+                if not _servir_connexion(serveur, connexion):
+                    return
+
+
+def lancer_travailleur(authkey: bytes, adresse=("localhost", 0)) -> tuple:
+    """Fonction démarrant un travailleur sans région dans un nouveau processus.
+
+    Args:
+        authkey (bytes): clé partagée avec le coordinateur, à garder secrète
+        adresse: adresse d'écoute, par défaut un port libre de la machine
+
+    Returns:
+        tuple: le processus du travailleur et l'adresse réellement écoutée
+    """
+    reception, annonce = Pipe(duplex=False)
+    processus = Process(target=servir_cellules, args=([], adresse, authkey, annonce))
+    processus.start()
+    return processus, reception.recv()
+
+
+class ClientCellules:
+    """Accès à un travailleur distant, avec les mêmes méthodes que ServeurCellules."""
+
+    def __init__(self, adresse, authkey: bytes, delai: float = 5.0):
+        fin = time.monotonic() + delai
+        while True:
+            try:
+                self.connexion = Client(adresse, authkey=authkey)
+                break
+            except ConnectionRefusedError:
+                if time.monotonic() > fin:
+                    raise
+                time.sleep(0.05)
+
+    def _appeler(self, methode: str, *arguments):
+        self.connexion.send((methode, arguments))
+        try:
+            statut, resultat = self.connexion.recv()
+        except EOFError:
+            raise ConnectionError(
+                f"Le travailleur a fermé la connexion pendant l'appel à {methode}"
+            ) from None
+        if statut == "erreur":
+            raise ValueError(resultat)
+        return resultat
+
+    def charger(self, regions: list[Region]):
+        return self._appeler("charger", regions)
+
+    def table(self, identifiant: int) -> dict[str, dict[str, float]]:
+        return self._appeler("table", identifiant)
+
+    def distances_depuis(self, identifiant: int, sommet: str) -> dict[str, float]:
+        return self._appeler("distances_depuis", identifiant, sommet)
+
+    def distances_vers(self, identifiant: int, sommet: str) -> dict[str, float]:
+        return self._appeler("distances_vers", identifiant, sommet)
+
+    def distance(self, identifiant: int, depart: str, arrivee: str) -> float:
+        return self._appeler("distance", identifiant, depart, arrivee)
+
+    def ralentissement(
+        self, identifiant: int, sommet_depart: str, sommet_arrivee: str, temps: float
+    ):
+        return self._appeler(
+            "ralentissement", identifiant, sommet_depart, sommet_arrivee, temps
+        )
+
+    def arreter(self):
+        """Arrête le travailleur distant et ferme la connexion."""
+        self._appeler("arreter")
+        self.connexion.close()
+
+    def fermer(self):
+        """Ferme la connexion sans arrêter le travailleur, qui attend alors un autre coordinateur."""
+        self.connexion.close()
+
+
+class RoutageOverlay:
+    """Coordinateur répondant aux requêtes par une recherche sur le second niveau du graphe de recouvrement.
+
+    Il garde la région de chaque emplacement, les sommets frontières de chaque
+    région, les routes entre régions (coupure), un travailleur (local ou distant)
+    par région et, au fil des requêtes, la table de chaque région. Les cellules,
+    leurs tables et les routes à l'intérieur d'une région restent chez les travailleurs.
+    """
+
+    def __init__(
+        self,
+        region_de: dict[str, int],
+        frontieres: dict[int, list[str]],
+        coupure: Graphe,
+        travailleurs: dict,
+    ):
+        self.region_de = region_de
+        self.frontieres = frontieres
+        self.coupure = coupure
+        self.travailleurs = travailleurs
+        self._tables = {}
+        self._sortantes = None
+
+    def _table(self, identifiant: int) -> dict[str, dict[str, float]]:
+        if identifiant not in self._tables:
+            self._tables[identifiant] = self.travailleurs[identifiant].table(
+                identifiant
+            )
+        return self._tables[identifiant]
+
+    def _region(self, sommet: str) -> int:
+        if sommet not in self.region_de:
+            raise ValueError(f"{sommet=} n'est pas dans la liste des sommets!")
+        return self.region_de[sommet]
+
+    def distance(self, depart: str, arrivee: str) -> float:
+        """Renvoie la distance la plus courte entre 2 emplacements de la ville.
+
+        Args:
+            depart (str): point de départ
+            arrivee (str): point d'arrivée
+
+        Raises:
+            ValueError: si l'un des emplacements n'existe pas
+
+        Returns:
+            float: distance la plus courte, inf si l'arrivée est inatteignable
+        """
+        region_depart = self._region(depart)
+        region_arrivee = self._region(arrivee)
+        depuis = self.travailleurs[region_depart].distances_depuis(
+            region_depart, depart
+        )
+        vers = self.travailleurs[region_arrivee].distances_vers(region_arrivee, arrivee)
+
+        if self._sortantes is None:
+            self._sortantes = {sommet: [] for sommet in self.coupure.sommets}
+            for sommet_depart, sommet_arrivee, poids in self.coupure.arretes:
+                self._sortantes[sommet_depart].append((sommet_arrivee, poids))
+
+        meilleure = float("inf")
+        if region_depart == region_arrivee:
+            meilleure = self.travailleurs[region_depart].distance(
+                region_depart, depart, arrivee
+            )
+        distances = dict(depuis)
+        tas = [(d, sommet) for sommet, d in distances.items()]
+        heapq.heapify(tas)
+        while tas:
+            d, sommet = heapq.heappop(tas)
+            if d >= meilleure:
+                break
+            if d > distances[sommet]:
+                continue
+            if sommet in vers:
+                meilleure = min(meilleure, d + vers[sommet])
+            voisins = self._sortantes[sommet] + list(
+                self._table(self.region_de[sommet])[sommet].items()
+            )
+            for voisin, poids in voisins:
+                if d + poids < distances.get(voisin, float("inf")):
+                    distances[voisin] = d + poids
+                    heapq.heappush(tas, (d + poids, voisin))
+        return meilleure
+
+    def ralentissement(self, sommet_depart: str, sommet_arrivee: str, temps: float):
+        """Applique un ralentissement, en ne recalculant que les tables de la cellule et de la région concernées.
+
+        Args:
+            sommet_depart (str): emplacement impacté par le ralentissement
+            sommet_arrivee (str): emplacement impacté par le ralentissement
+            temps (float): durée du ralentissement entre les 2 emplacements
+        """
+        region = self._region(sommet_depart)
+        if region != self._region(sommet_arrivee):
+            self.coupure = _ralentissement(
+                self.coupure, sommet_depart, sommet_arrivee, temps
+            )
+            self._sortantes = None
+            return
+        self.travailleurs[region].ralentissement(
+            region, sommet_depart, sommet_arrivee, temps
+        )
+        self._tables.pop(region, None)
+
+
+def construire_overlay(
+    graphe: Graphe,
+    nb_cellules: int,
+    nb_regions: int = 1,
+    adresses: list | None = None,
+    authkey: bytes | None = None,
+) -> RoutageOverlay:
+    """Fonction construisant un routage par overlay à 2 niveaux.
+
+        Sans adresses, toutes les régions sont gérées localement. Sinon, les
+        régions sont réparties à tour de rôle entre les travailleurs déjà
+        démarrés (par exemple avec lancer_travailleur) à ces adresses.
+
+    Args:
+        graphe (Graphe): Graphe de la ville
+        nb_cellules (int): nombre de cellules souhaité
+        nb_regions (int): nombre de régions (groupes de cellules) souhaité
+        adresses (list, optional): adresses des travailleurs
+        authkey (bytes, optional): clé partagée avec les travailleurs, obligatoire avec adresses
+
+    Raises:
+        ValueError: si des adresses sont données sans authkey
+
+    Returns:
+        RoutageOverlay: coordinateur du routage
+    """
+    if adresses is not None and authkey is None:
+        raise ValueError("Une authkey est nécessaire pour joindre les travailleurs")
+    cellules, coupure = decouper(graphe, partitionner(graphe, nb_cellules))
+    regions, coupure_regions = regrouper(cellules, coupure, nb_regions)
+
+    if adresses is None:
+        serveur = ServeurCellules(regions)
+        travailleurs = {region.identifiant: serveur for region in regions}
+    else:
+        clients = [ClientCellules(adresse, authkey) for adresse in adresses]
+        travailleurs = {
+            region.identifiant: clients[i % len(clients)]
+            for i, region in enumerate(regions)
+        }
+        for client in clients:
+            client.charger(
+                [r for r in regions if travailleurs[r.identifiant] is client]
+            )
+
+    return RoutageOverlay(
+        {
+            sommet: region.identifiant
+            for region in regions
+            for cellule in region.cellules
+            for sommet in cellule.graphe.sommets
+        },
+        {region.identifiant: region.frontiere for region in regions},
+        coupure_regions,
+        travailleurs,
+    )
@@ -28,61 +28,6 @@ def test_verifications_sommets():
         g = Graphe(sommets=list("BC"), arretes=[("A", "B", 1.5)])
 
 
-@pytest.fixture
-def Ex_graphe():
-    return Graphe(
-        sommets=[
-            "1",
-            "2",
-            "3",
-            "4",
-            "5",
-            "6",
-            "7",
-            "8",
-            "9",
-            "10",
-            "11",
-            "12",
-            "13",
-            "14",
-            "15",
-            "16",
-        ],
-        arretes=[
-            ("1", "2", 5.0),
-            ("1", "3", 9.0),
-            ("1", "4", 4.0),
-            ("2", "5", 3.0),
-            ("2", "6", 2.0),
-            ("3", "4", 4.0),
-            ("3", "6", 1.0),
-            ("4", "7", 7.0),
-            ("5", "8", 4.0),
-            ("5", "9", 2.0),
-            ("5", "10", 9.0),
-            ("6", "7", 3.0),
-            ("6", "10", 9.0),
-            ("6", "11", 6.0),
-            ("7", "11", 8.0),
-            ("7", "15", 5.0),
-            ("8", "12", 5.0),
-            ("9", "8", 3.0),
-            ("9", "13", 10.0),
-            ("10", "9", 6.0),
-            ("10", "13", 5.0),
-            ("10", "14", 1.0),
-            ("11", "14", 2.0),
-            ("12", "16", 9.0),
-            ("13", "12", 4.0),
-            ("13", "14", 3.0),
-            ("14", "16", 4.0),
-            ("15", "14", 4.0),
-            ("15", "16", 3.0),
-        ],
-    )
-
-
 @pytest.fixture
 def Ex_graphe2():
     return Graphe(
@@ -0,0 +1,72 @@
+import pytest
+from Lib.lib_graphe import bellman_ford_2
+from Lib.lib_oracle import OracleDistances, construire_oracle, charger_oracle
+
+
+def test_oracle_distance(Ex_graphe):
+    oracle = construire_oracle(Ex_graphe)
+    assert isinstance(oracle, OracleDistances)
+    assert oracle.distance("1", "16") == 18.0
+    assert oracle.distance("3", "3") == 0.0
+
+
+def test_oracle_toutes_distances(Ex_graphe):
+    oracle = construire_oracle(Ex_graphe)
+    attendue = bellman_ford_2(Ex_graphe)
+    for depart in Ex_graphe.sommets:
+        for arrivee in Ex_graphe.sommets:
+            assert oracle.distance(depart, arrivee) == attendue[depart][arrivee]
+
+
+def test_oracle_inatteignable(Ex_graphe):
+    oracle = construire_oracle(Ex_graphe)
+    assert oracle.distance("16", "1") == float("inf")
+
+
+def test_oracle_sommet_inconnu(Ex_graphe):
+    oracle = construire_oracle(Ex_graphe)
+    with pytest.raises(ValueError):
+        oracle.distance("1", "17")
+
+
+def test_oracle_distances(Ex_graphe):
+    oracle = construire_oracle(Ex_graphe)
+    attendue = bellman_ford_2(Ex_graphe)
+    departs = [d for d in Ex_graphe.sommets for _ in Ex_graphe.sommets]
+    arrivees = [a for _ in Ex_graphe.sommets for a in Ex_graphe.sommets]
+    resultat = oracle.distances(departs, arrivees)
+    assert list(resultat) == [attendue[d][a] for d, a in zip(departs, arrivees)]
+
+
+def test_oracle_distances_longueurs(Ex_graphe):
+    oracle = construire_oracle(Ex_graphe)
+    with pytest.raises(ValueError):
+        oracle.distances(["1", "2"], ["16"])
+
+
+def test_oracle_chemin(Ex_graphe):
+    oracle = construire_oracle(Ex_graphe)
+    attendue = {"distance": 18.0, "chemins": [["1", "2", "6", "7", "15", "16"]]}
+    assert oracle.chemin("1", "16") == attendue
+
+
+def test_oracle_sauvegarde(Ex_graphe, tmp_path):
+    oracle = construire_oracle(Ex_graphe)
+    fichier = tmp_path / "oracle.npz"
+    oracle.sauvegarder(fichier)
+    charge = charger_oracle(fichier)
+    assert charge.sommets == Ex_graphe.sommets
+    assert charge.distance("5", "13") == 12.0
+    assert list(charge.distances(["1", "5"], ["16", "13"])) == [18.0, 12.0]
+    with pytest.raises(ValueError):
+        charge.chemin("1", "16")
+
+
+def test_oracle_sauvegarde_sans_extension(Ex_graphe, tmp_path):
+    oracle = construire_oracle(Ex_graphe)
+    fichier = tmp_path / "oracle"
+    oracle.sauvegarder(str(fichier))
+    assert fichier.exists()
+    charge = charger_oracle(str(fichier), Ex_graphe)
+    assert charge.distance("1", "16") == 18.0
+    assert charge.chemin("1", "16")["distance"] == 18.0
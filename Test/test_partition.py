@@ -0,0 +1,216 @@
+from multiprocessing import AuthenticationError, Pipe
+from multiprocessing.connection import Client
+import secrets
+import threading
+
+import pytest
+from Lib.lib_graphe import bellman_ford_2, _ralentissement
+from Lib.lib_partition import (
+    Cellule,
+    Region,
+    ClientCellules,
+    ServeurCellules,
+    _servir_connexion,
+    construire_overlay,
+    decouper,
+    partitionner,
+    regrouper,
+    lancer_travailleur,
+)
+
+
+def test_partitionner(Ex_graphe):
+    cellule_de = partitionner(Ex_graphe, 4)
+    assert sorted(cellule_de) == sorted(Ex_graphe.sommets)
+    assert sorted(set(cellule_de.values())) == [0, 1, 2, 3]
+    assert all(list(cellule_de.values()).count(i) == 4 for i in range(4))
+
+
+def test_partitionner_2(Ex_graphe):
+    with pytest.raises(ValueError):
+        partitionner(Ex_graphe, 0)
+
+
+def test_decouper(Ex_graphe):
+    cellules, coupure = decouper(Ex_graphe, partitionner(Ex_graphe, 4))
+    assert all(isinstance(cellule, Cellule) for cellule in cellules)
+    nb_internes = sum(len(cellule.graphe.arretes) for cellule in cellules)
+    assert nb_internes + len(coupure.arretes) == len(Ex_graphe.arretes)
+    for cellule in cellules:
+        assert set(cellule.frontiere) <= set(coupure.sommets)
+
+
+def test_regrouper(Ex_graphe):
+    cellules, coupure = decouper(Ex_graphe, partitionner(Ex_graphe, 4))
+    regions, coupure_regions = regrouper(cellules, coupure, 2)
+    assert all(isinstance(region, Region) for region in regions)
+    assert sorted(c.identifiant for r in regions for c in r.cellules) == [0, 1, 2, 3]
+    nb_internes = sum(len(region.coupure.arretes) for region in regions)
+    assert nb_internes + len(coupure_regions.arretes) == len(coupure.arretes)
+    for region in regions:
+        assert set(region.frontiere) <= set(coupure_regions.sommets)
+
+
+@pytest.mark.parametrize(
+    "nb_cellules, nb_regions",
+    [(1, 1), (2, 1), (3, 2), (4, 1), (4, 2), (4, 4), (8, 3), (16, 4), (16, 16)],
+)
+def test_overlay_distances(Ex_graphe, nb_cellules, nb_regions):
+    overlay = construire_overlay(Ex_graphe, nb_cellules, nb_regions)
+    attendue = bellman_ford_2(Ex_graphe)
+    for depart in Ex_graphe.sommets:
+        for arrivee in Ex_graphe.sommets:
+            assert overlay.distance(depart, arrivee) == attendue[depart][arrivee]
+
+
+def test_overlay_sommet_inconnu(Ex_graphe):
+    overlay = construire_overlay(Ex_graphe, 4, 2)
+    with pytest.raises(ValueError):
+        overlay.distance("1", "17")
+
+
+@pytest.mark.parametrize("nb_cellules, nb_regions", [(4, 1), (4, 2), (8, 3)])
+def test_overlay_ralentissement(Ex_graphe, nb_cellules, nb_regions):
+    # Chaque route est soit interne à une cellule, soit entre 2 cellules d'une
+    # même région, soit entre 2 régions : on les essaie toutes.
+    for depart, arrivee, _ in Ex_graphe.arretes:
+        overlay = construire_overlay(Ex_graphe, nb_cellules, nb_regions)
+        overlay.distance("1", "16")
+        overlay.ralentissement(depart, arrivee, 10.0)
+        attendue = bellman_ford_2(_ralentissement(Ex_graphe, depart, arrivee, 10.0))
+        for sommet_depart in Ex_graphe.sommets:
+            for sommet_arrivee in Ex_graphe.sommets:
+                assert (
+                    overlay.distance(sommet_depart, sommet_arrivee)
+                    == attendue[sommet_depart][sommet_arrivee]
+                )
+
+
+def test_overlay_ralentissement_2(Ex_graphe):
+    overlay = construire_overlay(Ex_graphe, 4, 2)
+    with pytest.raises(ValueError):
+        overlay.ralentissement("9", "13", -3.0)
+    with pytest.raises(ValueError):
+        overlay.ralentissement("6", "7", -3.0)
+
+
+def test_serveur_ralentissement(Ex_graphe):
+    cellule_de = partitionner(Ex_graphe, 4)
+    cellules, coupure = decouper(Ex_graphe, cellule_de)
+    regions, _ = regrouper(cellules, coupure, 2)
+    serveur = ServeurCellules(regions)
+    region = serveur.region_de[cellule_de["6"]]
+    tables = dict(serveur.tables)
+    tables_regions = dict(serveur.tables_regions)
+    serveur.ralentissement(region, "6", "7", 10.0)
+    for i, table in tables.items():
+        assert (serveur.tables[i] is table) == (i != cellule_de["6"])
+    for i, table in tables_regions.items():
+        assert (serveur.tables_regions[i] is table) == (i != region)
+
+
+def test_overlay_rpc(Ex_graphe):
+    authkey = secrets.token_bytes()
+    travailleurs = [lancer_travailleur(authkey) for _ in range(2)]
+    overlay = construire_overlay(
+        Ex_graphe,
+        8,
+        4,
+        adresses=[adresse for _, adresse in travailleurs],
+        authkey=authkey,
+    )
+    clients = set(overlay.travailleurs.values())
+    try:
+        assert len(clients) == 2
+        attendue = bellman_ford_2(Ex_graphe)
+        for depart in Ex_graphe.sommets:
+            for arrivee in Ex_graphe.sommets:
+                assert overlay.distance(depart, arrivee) == attendue[depart][arrivee]
+        overlay.ralentissement("9", "13", 3.0)
+        assert overlay.distance("5", "13") == 14.0
+        client = overlay.travailleurs[0]
+        autre = next(i for i, c in overlay.travailleurs.items() if c is not client)
+        with pytest.raises(ValueError):
+            client.table(autre)
+    finally:
+        for client in clients:
+            client.arreter()
+        for processus, _ in travailleurs:
+            processus.join(timeout=5)
+    assert all(processus.exitcode == 0 for processus, _ in travailleurs)
+
+
+def test_overlay_rpc_sans_authkey(Ex_graphe):
+    with pytest.raises(ValueError):
+        construire_overlay(Ex_graphe, 4, 2, adresses=[("localhost", 1)])
+
+
+def _travailleur_region_unique(graphe, authkey):
+    cellules, coupure = decouper(graphe, partitionner(graphe, 4))
+    processus, adresse = lancer_travailleur(authkey)
+    client = ClientCellules(adresse, authkey)
+    client.charger(regrouper(cellules, coupure, 1)[0])
+    client.fermer()
+    return processus, adresse
+
+
+def test_rpc_erreur(Ex_graphe):
+    authkey = secrets.token_bytes()
+    processus, adresse = _travailleur_region_unique(Ex_graphe, authkey)
+    client = ClientCellules(adresse, authkey)
+    try:
+        with pytest.raises(ValueError, match="TypeError"):
+            client.ralentissement(0, "1", "2", "x")
+        with pytest.raises(ValueError, match="Méthode inconnue"):
+            client._appeler("__init__", [])
+        assert client.distance(0, "1", "16") == 18.0
+    finally:
+        client.arreter()
+        processus.join(timeout=5)
+    assert processus.exitcode == 0
+
+
+def test_rpc_connexion_fermee(Ex_graphe):
+    authkey = secrets.token_bytes()
+    processus, adresse = _travailleur_region_unique(Ex_graphe, authkey)
+    client = ClientCellules(adresse, authkey)
+    processus.terminate()
+    processus.join(timeout=5)
+    with pytest.raises(ConnectionError):
+        client.table(0)
+
+
+def test_rpc_deconnexion(Ex_graphe):
+    authkey = secrets.token_bytes()
+    processus, adresse = _travailleur_region_unique(Ex_graphe, authkey)
+    Client(adresse, authkey=authkey).close()
+    with pytest.raises(AuthenticationError):
+        Client(adresse, authkey=b"mauvaise cle")
+    client = ClientCellules(adresse, authkey)
+    try:
+        assert client.distance(0, "1", "16") == 18.0
+    finally:
+        client.arreter()
+        processus.join(timeout=5)
+    assert processus.exitcode == 0
+
+
+def test_servir_connexion(Ex_graphe, monkeypatch):
+    cellules, coupure = decouper(Ex_graphe, partitionner(Ex_graphe, 4))
+    serveur = ServeurCellules(regrouper(cellules, coupure, 1)[0])
+    monkeypatch.setattr(serveur, "table", lambda identifiant: lambda: identifiant)
+    client, bout_serveur = Pipe()
+    fil = threading.Thread(target=_servir_connexion, args=(serveur, bout_serveur))
+    fil.start()
+    client.send(("table", (0,)))
+    statut, message = client.recv()
+    assert statut == "erreur" and "Réponse impossible" in message
+    client.send_bytes(b"pas du pickle")
+    statut, message = client.recv()
+    assert statut == "erreur" and "Requête illisible" in message
+    client.send(("distance", (0, "1", "16")))
+    assert client.recv() == ("ok", 18.0)
+    client.send(("arreter", ()))
+    assert client.recv() == ("ok", None)
+    fil.join(timeout=5)
+    assert not fil.is_alive()